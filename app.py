@@ -13,8 +13,16 @@ def main() -> None:
     """
     Application main entry function
 
-    Initialize application layout and render the entire UI
+    Configure the page, initialize application layout and render the entire UI
     """
+    # Set page to wide screen mode (must be the first Streamlit call of the run)
+    st.set_page_config(
+        page_title="人才金字塔预测 | Workforce Compass",
+        page_icon="📊",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+
     # Create application layout instance
     layout = AppLayout()
     # Render application interface
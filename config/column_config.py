@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 # Table column configuration
 COLUMN_CONFIG = {
     "level": {
@@ -96,3 +98,8 @@ COLUMN_CONFIG = {
         "format": "%.2f"
     }
 }
+
+# Expose the configuration read-only, it is shared by every render
+COLUMN_CONFIG = MappingProxyType({
+    col: MappingProxyType(config) for col, config in COLUMN_CONFIG.items()
+})
@@ -1,6 +1,7 @@
 import os
 from typing import Dict, List, Any, Union, Optional
 
+import numpy as np
 import pandas as pd
 
 from config.constants import LEVELS, DEFAULT_CAMPUS_RATIO
@@ -24,7 +25,7 @@ class DataProcessor:
         "hiring_ratio"
     ]
 
-    # Define integer and float columns
+    # Define integer and float columns (rate columns hold fractions, the editor shows them as percentages)
     INTEGER_COLUMNS: List[str] = ['campus_employee', 'social_employee']
 
     FLOAT_COLUMNS: List[str] = [
@@ -35,6 +36,22 @@ class DataProcessor:
         'hiring_ratio'
     ]
 
+    # Map per-level prediction parameters to their source columns
+    PARAM_COLUMNS: Dict[str, str] = {
+        'current_campus_employees': 'campus_employee',
+        'current_social_employees': 'social_employee',
+        'current_campus_ages': 'campus_age',
+        'current_social_ages': 'social_age',
+        'campus_leaving_ages': 'campus_leaving_age',
+        'social_leaving_ages': 'social_leaving_age',
+        'social_new_hire_ages': 'social_new_hire_age',
+        'campus_promotion_rates': 'campus_promotion_rate',
+        'social_promotion_rates': 'social_promotion_rate',
+        'campus_attrition_rates': 'campus_attrition_rate',
+        'social_attrition_rates': 'social_attrition_rate',
+        'hiring_ratios': 'hiring_ratio'
+    }
+
     @staticmethod
     def normalize_level(level_value) -> int:
         """
@@ -57,6 +74,31 @@ class DataProcessor:
         else:
             raise ValueError(f"Invalid level format: {level_value}. Expected L1-L7 format.")
 
+    @staticmethod
+    def normalize_levels(levels: pd.Series) -> pd.Series:
+        """
+        Vectorized counterpart of normalize_level for a whole level column
+
+        Args:
+            levels: Series of level values (L1-L7 format)
+
+        Returns:
+            pd.Series: Numeric levels (1-7)
+        """
+        level_strs = levels.astype(str)
+        valid_format = level_strs.str.fullmatch(r"L\d+")
+        if not valid_format.all():
+            invalid_value = levels[~valid_format].iloc[0]
+            raise ValueError(f"Invalid level format: {invalid_value}. Expected L1-L7 format.")
+
+        level_nums = level_strs.str.slice(1).astype(int)  # Extract number after 'L'
+        valid_range = level_nums.between(1, 7)
+        if not valid_range.all():
+            invalid_num = level_nums[~valid_range].iloc[0]
+            raise ValueError(f"Invalid level number: {invalid_num}. Expected 1-7.")
+
+        return level_nums
+
     @staticmethod
     def load_preset_from_csv(file_path: str) -> pd.DataFrame:
         """
@@ -73,8 +115,8 @@ class DataProcessor:
             Exception: Other errors when loading CSV file
         """
         try:
-            # Read CSV file
-            df = pd.read_csv(file_path)
+            # Read CSV file with the multi-threaded pyarrow parser
+            df = pd.read_csv(file_path, engine='pyarrow')
 
             # Check if required columns exist
             missing_columns = [col for col in DataProcessor.REQUIRED_COLUMNS if col not in df.columns]
@@ -82,13 +124,17 @@ class DataProcessor:
                 raise ValueError(f"CSV file is missing required columns: {', '.join(missing_columns)}")
 
             # Convert level column from L1-L7 to numeric 1-7
-            df['level'] = df['level'].apply(DataProcessor.normalize_level)
+            df['level'] = DataProcessor.normalize_levels(df['level'])
 
-            # Handle NaN values in integer columns
-            df[DataProcessor.INTEGER_COLUMNS] = df[DataProcessor.INTEGER_COLUMNS].fillna(0).astype(int)
+            # Handle NaN values in integer columns (filled while converting, then cast as a bare array)
+            df[DataProcessor.INTEGER_COLUMNS] = (
+                df[DataProcessor.INTEGER_COLUMNS].to_numpy(dtype=np.float64, na_value=0.0).astype(np.int64)
+            )
 
             # Handle NaN values in float columns
-            df[DataProcessor.FLOAT_COLUMNS] = df[DataProcessor.FLOAT_COLUMNS].fillna(0.0).astype(float)
+            df[DataProcessor.FLOAT_COLUMNS] = (
+                df[DataProcessor.FLOAT_COLUMNS].to_numpy(dtype=np.float64, na_value=0.0)
+            )
 
             return df
 
@@ -119,26 +165,29 @@ class DataProcessor:
         Returns:
             Dict[str, Union[int, float]]: Dictionary containing calculated current metrics
         """
+        campus_employees = df['campus_employee'].to_numpy()
+        social_employees = df['social_employee'].to_numpy()
+
         # Calculate total headcount (sum of campus and social recruitment)
-        total_employees = df['campus_employee'] + df['social_employee']
+        total_employees = campus_employees + social_employees
         current_total = int(total_employees.sum())
 
         # Calculate current average level
         current_average_level = (
-            sum(df['level'] * (df['campus_employee'] + df['social_employee'])) /
+            float(df['level'].to_numpy() @ total_employees) /
             current_total if current_total != 0 else 0.0
         )
 
         # Calculate current total age and average age
-        current_total_age = sum(
-            df['campus_employee'] * df['campus_age'] +
-            df['social_employee'] * df['social_age']
+        current_total_age = float(
+            campus_employees @ df['campus_age'].to_numpy() +
+            social_employees @ df['social_age'].to_numpy()
         )
         current_average_age = current_total_age / current_total if current_total != 0 else 0.0
 
         # Calculate current campus recruitment ratio
         current_campus_ratio = (
-            df['campus_employee'].sum() / current_total if current_total > 0 else 0.0
+            float(campus_employees.sum()) / current_total if current_total > 0 else 0.0
         )
 
         return {
@@ -167,22 +216,15 @@ class DataProcessor:
         Returns:
             Dict[str, Any]: Dictionary containing all parameters required for prediction
         """
-        # Convert DataFrame to dictionary format for use by prediction model
-        params = {
-            'current_campus_employees': df.set_index('level')['campus_employee'].to_dict(),
-            'current_social_employees': df.set_index('level')['social_employee'].to_dict(),
-            'current_campus_ages': df.set_index('level')['campus_age'].to_dict(),
-            'current_social_ages': df.set_index('level')['social_age'].to_dict(),
-            'campus_leaving_ages': df.set_index('level')['campus_leaving_age'].to_dict(),
-            'social_leaving_ages': df.set_index('level')['social_leaving_age'].to_dict(),
-            'social_new_hire_ages': df.set_index('level')['social_new_hire_age'].to_dict(),
+        # Share one pass over the level column across all per-level parameters
+        levels = df['level'].tolist()
+        params: Dict[str, Any] = {
+            param_name: dict(zip(levels, df[column].tolist()))
+            for param_name, column in DataProcessor.PARAM_COLUMNS.items()
+        }
+        params.update({
             'campus_new_hire_age': campus_new_hire_age,
-            'campus_promotion_rates': df.set_index('level')['campus_promotion_rate'].to_dict(),
-            'social_promotion_rates': df.set_index('level')['social_promotion_rate'].to_dict(),
-            'campus_attrition_rates': df.set_index('level')['campus_attrition_rate'].to_dict(),
-            'social_attrition_rates': df.set_index('level')['social_attrition_rate'].to_dict(),
-            'hiring_ratios': df.set_index('level')['hiring_ratio'].to_dict(),
             'campus_ratio': campus_ratio,
             'target_total': target_total
-        }
+        })
         return params
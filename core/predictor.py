@@ -1,5 +1,206 @@
 from typing import Dict, List, Any, Optional, Tuple
 
+import numpy as np
+
+from config.constants import LEVELS
+
+try:
+    from numba import njit
+except ImportError:  # numba is a listed requirement; keep running as plain NumPy without it
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+def _to_array(
+    values: Dict[int, float],
+    dtype: type = np.float64,
+    _levels: Tuple[int, ...] = tuple(sorted(LEVELS))
+) -> np.ndarray:
+    """
+    Convert a level-keyed dictionary to an array ordered from lowest to highest level
+
+    Args:
+        values: Values keyed by level
+        dtype: Element type of the resulting array
+
+    Returns:
+        np.ndarray: Array where index 0 holds the lowest level
+    """
+    return np.array([values[level] for level in _levels], dtype=dtype)
+
+
+def _to_finite_array(
+    values: Dict[int, float],
+    name: str,
+    _levels: Tuple[int, ...] = tuple(sorted(LEVELS))
+) -> np.ndarray:
+    """
+    Convert a level-keyed dictionary to a float array, rejecting missing values
+
+    The kernel casts rounded headcounts to int64, which would turn NaN into
+    arbitrary integers, so blank cells must be caught before they reach it.
+
+    Args:
+        values: Values keyed by level
+        name: Parameter name used in the error message
+
+    Returns:
+        np.ndarray: Array where index 0 holds the lowest level
+
+    Raises:
+        ValueError: When any level has a missing or non-finite value
+    """
+    array = _to_array(values)
+    finite = np.isfinite(array)
+    if not finite.all():
+        bad_levels = ', '.join(f"L{level}" for level, ok in zip(_levels, finite) if not ok)
+        raise ValueError(f"{name} has missing or non-finite values at {bad_levels}")
+    return array
+
+
+def _to_level_dict(
+    values: np.ndarray,
+    _levels: Tuple[int, ...] = tuple(sorted(LEVELS))
+) -> Dict[int, int]:
+    """
+    Convert an array ordered from lowest to highest level back to a level-keyed dictionary
+
+    Args:
+        values: Array where index 0 holds the lowest level
+
+    Returns:
+        Dict[int, int]: Values keyed by level
+    """
+    return dict(zip(_levels, values.tolist()))
+
+
+@njit(cache=True)
+def _predict_one_year_kernel(
+    levels: np.ndarray,
+    camp: np.ndarray,
+    soc: np.ndarray,
+    c_leave_age: np.ndarray,
+    s_leave_age: np.ndarray,
+    s_new_age: np.ndarray,
+    c_new_age: float,
+    c_promo: np.ndarray,
+    s_promo: np.ndarray,
+    c_attr: np.ndarray,
+    s_attr: np.ndarray,
+    hr_ratio: np.ndarray,
+    campus_ratio: float,
+    target_total: int,
+    current_total_age: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, float, float, float, int, np.ndarray, float]:
+    """
+    Numeric core of the one-year prediction
+
+    All array arguments are ordered from lowest to highest level, with `levels`
+    holding the numeric level of each position. Headcounts are int64 and rates are
+    float64 fractions (0-1), applied to headcounts without further scaling. Compiled with numba when it is
+    installed, otherwise executed as plain NumPy code.
+
+    Returns:
+        Same tuple as HRPredictor.predict_one_year, with per-level values as arrays
+    """
+    # Step 1: Calculate promotion adjustments
+    # Number of employees promoted out of each level
+    promoted_out_campus = np.round(camp * c_promo).astype(np.int64)
+    promoted_out_social = np.round(soc * s_promo).astype(np.int64)
+
+    # Number of employees promoted in from the level below (nobody enters the lowest level)
+    promoted_in_campus = np.zeros_like(promoted_out_campus)
+    promoted_in_campus[1:] = promoted_out_campus[:-1]
+    promoted_in_social = np.zeros_like(promoted_out_social)
+    promoted_in_social[1:] = promoted_out_social[:-1]
+
+    # Headcount after promotion adjustments
+    A_campus = camp - promoted_out_campus + promoted_in_campus
+    A_social = soc - promoted_out_social + promoted_in_social
+
+    # Step 2: Calculate attrition adjustments
+    # Expected leavers per level, reused below for attrition totals and ages
+    campus_leaving = camp * c_attr
+    social_leaving = soc * s_attr
+
+    B_campus = np.round(A_campus - campus_leaving).astype(np.int64)
+    B_social = np.round(A_social - social_leaving).astype(np.int64)
+    B = B_campus + B_social
+
+    # Step 3: Calculate total hiring needs
+    total_B = B.sum()
+    campus_hiring = int(np.rint(target_total * campus_ratio))
+    total_social_hiring_needed = target_total - total_B - campus_hiring
+
+    # Step 4: Allocate social recruitment hiring slots
+    initial_C = np.rint(total_social_hiring_needed * hr_ratio).astype(np.int64)
+
+    # Absorb any rounding difference in the level with maximum hiring (a no-op when it is zero)
+    initial_C[np.argmax(initial_C)] += total_social_hiring_needed - initial_C.sum()
+
+    C = np.maximum(initial_C, 0)
+    social_hiring_total = C.sum()
+
+    # Step 5: Projected year-end headcount by level (campus hires all enter the lowest level)
+    final_campus = B_campus.copy()
+    final_campus[0] += campus_hiring
+    final_social = B_social + C
+    final_structure = B + C
+    final_structure[0] += campus_hiring
+
+    # Calculate predicted total headcount from the step totals
+    predicted_total = total_B + campus_hiring + social_hiring_total
+
+    # Calculate predicted average level
+    predicted_average_level = (
+        (levels * final_structure).sum() / predicted_total
+        if predicted_total != 0 else 0.0
+    )
+
+    # Calculate current total headcount
+    current_total = camp.sum() + soc.sum()
+
+    # Calculate total attrition headcount and total attrition age
+    campus_leaving_total = campus_leaving.sum()
+    social_leaving_total = social_leaving.sum()
+    campus_leaving_total_age = (campus_leaving * c_leave_age).sum()
+    social_leaving_total_age = (social_leaving * s_leave_age).sum()
+
+    # Calculate retained headcount
+    survived_total = current_total - (campus_leaving_total + social_leaving_total)
+
+    # Calculate predicted total age
+    predicted_total_age = (
+        current_total_age -
+        (campus_leaving_total_age + social_leaving_total_age) +
+        survived_total * 1 +
+        campus_hiring * c_new_age +
+        (C * s_new_age).sum()
+    )
+
+    # Calculate predicted average age
+    predicted_average_age = predicted_total_age / predicted_total if predicted_total != 0 else 0.0
+
+    # Calculate predicted campus recruitment ratio
+    predicted_campus_ratio = (
+        final_campus.sum() / predicted_total
+        if predicted_total > 0 else 0.0
+    )
+
+    return (
+        final_campus,
+        final_social,
+        final_structure,
+        predicted_average_level,
+        predicted_average_age,
+        predicted_campus_ratio,
+        campus_hiring,
+        C,
+        predicted_total_age
+    )
+
 
 class HRPredictor:
     """
@@ -13,6 +214,38 @@ class HRPredictor:
     MIN_LEVEL: int = 1
     MAX_LEVEL: int = 7
     LEVEL_RANGE: range = range(MIN_LEVEL, MAX_LEVEL + 1)  # From 1 to 7
+    LEVEL_ARR: np.ndarray = np.arange(MIN_LEVEL, MAX_LEVEL + 1, dtype=np.int64)  # Same levels as an array
+
+    @staticmethod
+    def _initial_total_age(
+        camp: np.ndarray,
+        soc: np.ndarray,
+        current_campus_ages: Optional[Dict[int, float]],
+        current_social_ages: Optional[Dict[int, float]]
+    ) -> float:
+        """
+        Calculate total age of the current workforce from per-level average ages
+
+        Args:
+            camp: Current campus recruitment headcount ordered by level
+            soc: Current social recruitment headcount ordered by level
+            current_campus_ages: Current average age of campus recruits by level
+            current_social_ages: Current average age of social recruits by level
+
+        Returns:
+            float: Current total age
+
+        Raises:
+            ValueError: When age data is missing
+        """
+        # Ensure current_campus_ages and current_social_ages are not None
+        if current_campus_ages is None or current_social_ages is None:
+            raise ValueError("First year prediction requires current campus and social recruitment age data")
+
+        return float(
+            np.dot(camp, _to_finite_array(current_campus_ages, 'current_campus_ages')) +
+            np.dot(soc, _to_finite_array(current_social_ages, 'current_social_ages'))
+        )
 
     def predict_one_year(
         self,
@@ -55,12 +288,12 @@ class HRPredictor:
             social_leaving_ages: Average leaving age of social recruits
             social_new_hire_ages: Average age of new social hires
             campus_new_hire_age: Average age of new campus hires
-            campus_promotion_rates: Campus recruitment promotion rates
-            social_promotion_rates: Social recruitment promotion rates
-            campus_attrition_rates: Campus recruitment attrition rates
-            social_attrition_rates: Social recruitment attrition rates
-            hiring_ratios: Social recruitment distribution ratios
-            campus_ratio: Campus recruitment ratio
+            campus_promotion_rates: Campus recruitment promotion rates (fractions, e.g. 0.15 for 15%)
+            social_promotion_rates: Social recruitment promotion rates (fractions)
+            campus_attrition_rates: Campus recruitment attrition rates (fractions)
+            social_attrition_rates: Social recruitment attrition rates (fractions)
+            hiring_ratios: Social recruitment distribution ratios (fractions summing to 1)
+            campus_ratio: Campus recruitment ratio (fraction of target total)
             target_total: Target total headcount
             previous_predicted_total_age: Total age predicted from previous year
 
@@ -76,151 +309,16 @@ class HRPredictor:
             - C: Social recruitment new hires
             - predicted_total_age: Predicted total age
         """
-        # Step 1: Calculate promotion adjustments
-        A_campus: Dict[int, int] = {}
-        A_social: Dict[int, int] = {}
-
-        for level in self.LEVEL_RANGE:
-            # Calculate number of employees promoted out
-            promoted_out_campus = round(current_campus_employees[level] * campus_promotion_rates[level])
-            promoted_out_social = round(current_social_employees[level] * social_promotion_rates[level])
-
-            # Calculate number of employees promoted in from lower level
-            promoted_in_campus = round(current_campus_employees[level-1] * campus_promotion_rates[level-1]) if level > self.MIN_LEVEL else 0
-            promoted_in_social = round(current_social_employees[level-1] * social_promotion_rates[level-1]) if level > self.MIN_LEVEL else 0
-
-            # Calculate headcount after promotion adjustments
-            A_campus[level] = current_campus_employees[level] - promoted_out_campus + promoted_in_campus
-            A_social[level] = current_social_employees[level] - promoted_out_social + promoted_in_social
-
-        # Step 2: Calculate attrition adjustments
-        B_campus: Dict[int, int] = {
-            level: round(A_campus[level] - current_campus_employees[level] * campus_attrition_rates[level])
-            for level in self.LEVEL_RANGE
-        }
-
-        B_social: Dict[int, int] = {
-            level: round(A_social[level] - current_social_employees[level] * social_attrition_rates[level])
-            for level in self.LEVEL_RANGE
-        }
-
-        B: Dict[int, int] = {
-            level: B_campus[level] + B_social[level]
-            for level in self.LEVEL_RANGE
-        }
-
-        # Step 3: Calculate total hiring needs
-        total_B = sum(B.values())
-        campus_hiring = round(target_total * campus_ratio)
-        total_social_hiring_needed = target_total - total_B - campus_hiring
-
-        # Step 4: Allocate social recruitment hiring slots
-        initial_C: Dict[int, int] = {
-            level: round(total_social_hiring_needed * hiring_ratios[level])
-            for level in self.LEVEL_RANGE
-        }
-
-        initial_total = sum(initial_C.values())
-
-        # If rounded total doesn't match target, adjust the level with maximum hiring
-        if initial_total != total_social_hiring_needed:
-            diff = total_social_hiring_needed - initial_total
-            max_hiring_level = max(self.LEVEL_RANGE, key=lambda x: initial_C[x])
-            initial_C[max_hiring_level] += diff
-
-        C: Dict[int, int] = {
-            level: max(0, initial_C[level])
-            for level in self.LEVEL_RANGE
-        }
-
-        # Step 5: Projected year-end headcount by level
-        final_campus: Dict[int, int] = {
-            level: B_campus[level] + (campus_hiring if level == self.MIN_LEVEL else 0)
-            for level in self.LEVEL_RANGE
-        }
-
-        final_social: Dict[int, int] = {
-            level: B_social[level] + C[level]
-            for level in self.LEVEL_RANGE
-        }
-
-        final_structure: Dict[int, int] = {
-            level: final_campus[level] + final_social[level]
-            for level in self.LEVEL_RANGE
-        }
-
-        # Calculate predicted total headcount
-        predicted_total = sum(final_structure.values())
-
-        # Calculate predicted average level
-        predicted_average_level = (
-            sum(level * final_structure[level] for level in self.LEVEL_RANGE) / predicted_total
-            if predicted_total != 0 else 0.0
-        )
-
-        # Calculate current total headcount
-        current_total = sum(
-            current_campus_employees[l] + current_social_employees[l]
-            for l in self.LEVEL_RANGE
-        )
+        camp = _to_array(current_campus_employees, np.int64)
+        soc = _to_array(current_social_employees, np.int64)
 
         # Calculate current total age
         if previous_predicted_total_age is None:
-            # Ensure current_campus_ages and current_social_ages are not None
-            if current_campus_ages is None or current_social_ages is None:
-                raise ValueError("First year prediction requires current campus and social recruitment age data")
-
-            current_total_age = sum(
-                current_campus_employees[l] * current_campus_ages[l] +
-                current_social_employees[l] * current_social_ages[l]
-                for l in self.LEVEL_RANGE
-            )
+            current_total_age = self._initial_total_age(camp, soc, current_campus_ages, current_social_ages)
         else:
             current_total_age = previous_predicted_total_age
 
-        # Calculate total attrition headcount and total attrition age
-        campus_leaving_total = sum(
-            current_campus_employees[level] * campus_attrition_rates[level]
-            for level in self.LEVEL_RANGE
-        )
-
-        social_leaving_total = sum(
-            current_social_employees[level] * social_attrition_rates[level]
-            for level in self.LEVEL_RANGE
-        )
-
-        campus_leaving_total_age = sum(
-            current_campus_employees[level] * campus_attrition_rates[level] * campus_leaving_ages[level]
-            for level in self.LEVEL_RANGE
-        )
-
-        social_leaving_total_age = sum(
-            current_social_employees[level] * social_attrition_rates[level] * social_leaving_ages[level]
-            for level in self.LEVEL_RANGE
-        )
-
-        # Calculate retained headcount
-        survived_total = current_total - (campus_leaving_total + social_leaving_total)
-
-        # Calculate predicted total age
-        predicted_total_age = (
-            current_total_age -
-            (campus_leaving_total_age + social_leaving_total_age) +
-            survived_total * 1 +
-            campus_hiring * campus_new_hire_age +
-            sum(C[level] * social_new_hire_ages[level] for level in self.LEVEL_RANGE)
-        )
-
-        # Calculate predicted average age
-        predicted_average_age = predicted_total_age / predicted_total if predicted_total != 0 else 0.0
-
-        # Calculate predicted campus recruitment ratio
-        predicted_campus_ratio = (
-            sum(final_campus[l] for l in self.LEVEL_RANGE) / predicted_total
-            if predicted_total > 0 else 0.0
-        )
-
-        return (
+        (
             final_campus,
             final_social,
             final_structure,
@@ -230,6 +328,34 @@ class HRPredictor:
             campus_hiring,
             C,
             predicted_total_age
+        ) = _predict_one_year_kernel(
+            self.LEVEL_ARR,
+            camp,
+            soc,
+            _to_finite_array(campus_leaving_ages, 'campus_leaving_ages'),
+            _to_finite_array(social_leaving_ages, 'social_leaving_ages'),
+            _to_finite_array(social_new_hire_ages, 'social_new_hire_ages'),
+            float(campus_new_hire_age),
+            _to_finite_array(campus_promotion_rates, 'campus_promotion_rates'),
+            _to_finite_array(social_promotion_rates, 'social_promotion_rates'),
+            _to_finite_array(campus_attrition_rates, 'campus_attrition_rates'),
+            _to_finite_array(social_attrition_rates, 'social_attrition_rates'),
+            _to_finite_array(hiring_ratios, 'hiring_ratios'),
+            float(campus_ratio),
+            int(target_total),
+            float(current_total_age)
+        )
+
+        return (
+            _to_level_dict(final_campus),
+            _to_level_dict(final_social),
+            _to_level_dict(final_structure),
+            float(predicted_average_level),
+            float(predicted_average_age),
+            float(predicted_campus_ratio),
+            int(campus_hiring),
+            _to_level_dict(C),
+            float(predicted_total_age)
         )
 
     def predict_multiple_years(
@@ -249,35 +375,33 @@ class HRPredictor:
         """
         multi_year_results: List[Dict[str, Any]] = []
 
+        # Convert parameters that stay constant across years to arrays once, rejecting blank cells
+        campus_leaving_ages = _to_finite_array(initial_params['campus_leaving_ages'], 'campus_leaving_ages')
+        social_leaving_ages = _to_finite_array(initial_params['social_leaving_ages'], 'social_leaving_ages')
+        social_new_hire_ages = _to_finite_array(initial_params['social_new_hire_ages'], 'social_new_hire_ages')
+        campus_promotion_rates = _to_finite_array(initial_params['campus_promotion_rates'], 'campus_promotion_rates')
+        social_promotion_rates = _to_finite_array(initial_params['social_promotion_rates'], 'social_promotion_rates')
+        campus_attrition_rates = _to_finite_array(initial_params['campus_attrition_rates'], 'campus_attrition_rates')
+        social_attrition_rates = _to_finite_array(initial_params['social_attrition_rates'], 'social_attrition_rates')
+        hiring_ratios = _to_finite_array(initial_params['hiring_ratios'], 'hiring_ratios')
+        campus_new_hire_age = float(initial_params['campus_new_hire_age'])
+        campus_ratio = float(initial_params['campus_ratio'])
+        target_total = int(initial_params['target_total'])
+
         # Initialize input data for first year
-        current_year_campus = initial_params['current_campus_employees'].copy()
-        current_year_social = initial_params['current_social_employees'].copy()
-        current_year_campus_ages = initial_params['current_campus_ages'].copy()
-        current_year_social_ages = initial_params['current_social_ages'].copy()
-        previous_predicted_total_age: Optional[float] = None
+        current_year_campus = _to_array(initial_params['current_campus_employees'], np.int64)
+        current_year_social = _to_array(initial_params['current_social_employees'], np.int64)
+        current_campus_dict = initial_params['current_campus_employees']
+        current_social_dict = initial_params['current_social_employees']
+        current_total_age = self._initial_total_age(
+            current_year_campus,
+            current_year_social,
+            initial_params['current_campus_ages'],
+            initial_params['current_social_ages']
+        )
 
         # Loop to predict multiple years
         for year in range(forecast_years):
-            result = self.predict_one_year(
-                current_year_campus,
-                current_year_social,
-                current_year_campus_ages if year == 0 else None,
-                current_year_social_ages if year == 0 else None,
-                initial_params['campus_leaving_ages'],
-                initial_params['social_leaving_ages'],
-                initial_params['social_new_hire_ages'],
-                initial_params['campus_new_hire_age'],
-                initial_params['campus_promotion_rates'],
-                initial_params['social_promotion_rates'],
-                initial_params['campus_attrition_rates'],
-                initial_params['social_attrition_rates'],
-                initial_params['hiring_ratios'],
-                initial_params['campus_ratio'],
-                initial_params['target_total'],
-                previous_predicted_total_age if year > 0 else None
-            )
-
-            # Unpack results
             (
                 final_campus,
                 final_social,
@@ -288,27 +412,47 @@ class HRPredictor:
                 campus_hiring,
                 social_hiring,
                 predicted_total_age
-            ) = result
+            ) = _predict_one_year_kernel(
+                self.LEVEL_ARR,
+                current_year_campus,
+                current_year_social,
+                campus_leaving_ages,
+                social_leaving_ages,
+                social_new_hire_ages,
+                campus_new_hire_age,
+                campus_promotion_rates,
+                social_promotion_rates,
+                campus_attrition_rates,
+                social_attrition_rates,
+                hiring_ratios,
+                campus_ratio,
+                target_total,
+                current_total_age
+            )
+            final_campus_dict = _to_level_dict(final_campus)
+            final_social_dict = _to_level_dict(final_social)
 
             # Store current year prediction results
             multi_year_results.append({
                 'year': year + 1,
-                'current_campus': current_year_campus.copy(),
-                'current_social': current_year_social.copy(),
-                'final_campus': final_campus,
-                'final_social': final_social,
-                'final_structure': final_structure,
-                'average_level': predicted_average_level,
-                'average_age': predicted_average_age,
-                'campus_ratio': predicted_campus_ratio,
-                'campus_hiring': campus_hiring,
-                'social_hiring': social_hiring,
-                'total_age': predicted_total_age
+                'current_campus': current_campus_dict,
+                'current_social': current_social_dict,
+                'final_campus': final_campus_dict,
+                'final_social': final_social_dict,
+                'final_structure': _to_level_dict(final_structure),
+                'average_level': float(predicted_average_level),
+                'average_age': float(predicted_average_age),
+                'campus_ratio': float(predicted_campus_ratio),
+                'campus_hiring': int(campus_hiring),
+                'social_hiring': _to_level_dict(social_hiring),
+                'total_age': float(predicted_total_age)
             })
 
-            # Update input data for next year
-            current_year_campus = final_campus.copy()
-            current_year_social = final_social.copy()
-            previous_predicted_total_age = predicted_total_age
+            # Update input data for next year (the kernel returns fresh arrays)
+            current_year_campus = final_campus
+            current_year_social = final_social
+            current_campus_dict = final_campus_dict
+            current_social_dict = final_social_dict
+            current_total_age = float(predicted_total_age)
 
         return multi_year_results
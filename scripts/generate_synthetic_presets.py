@@ -1,6 +1,6 @@
 import argparse
 import os
-import random
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Tuple
 
 import numpy as np
@@ -11,77 +11,52 @@ import pandas as pd
 # Helpers
 # -----------------------------
 
-def set_seed(seed: int) -> None:
-    random.seed(seed)
-    np.random.seed(seed)
-
-
 def round_to_step(values: List[float], target_sum: int, step: int = 5, low: List[int] = None, high: List[int] = None) -> List[int]:
     """
     Round a list of float values to integers in multiples of `step` and rebalance to match target_sum.
     Optional per-item lower/upper bounds can be provided via `low` and `high`.
     """
-    n = len(values)
-    low = low or [0] * n
-    high = high or [None] * n
+    vals = np.asarray(values, dtype=np.float64)
+    n = len(vals)
+    lo = np.zeros(n, dtype=np.int64) if low is None else np.asarray(low, dtype=np.int64)
+    no_cap = np.iinfo(np.int64).max
+    hi = np.full(n, no_cap, dtype=np.int64) if high is None else np.array(
+        [no_cap if h is None else h for h in high], dtype=np.int64
+    )
 
     # Initial rounding
-    ints = [int(step * round(v / step)) for v in values]
+    ints = (step * np.round(vals / step)).astype(np.int64)
 
     # Apply bounds
-    for i in range(n):
-        if high[i] is not None and ints[i] > high[i]:
-            ints[i] = high[i] - (high[i] % step)
-        if ints[i] < low[i]:
-            ints[i] = low[i]
-
-    # Rebalance to target
-    current = sum(ints)
-    diff = target_sum - current
-
-    # Helper to try to adjust one index by +/- step under bounds
-    def try_adjust(idx: int, delta: int) -> bool:
-        new_val = ints[idx] + delta
-        if new_val < low[idx]:
-            return False
-        if high[idx] is not None and new_val > high[idx]:
-            return False
-        if new_val < 0:
-            return False
-        ints[idx] = new_val
-        return True
-
-    # Distribute difference greedily with cycling
-    indices = list(range(n))
-    cycles = 0
-    while diff != 0 and cycles < n * 1000:  # safety cap
-        random.shuffle(indices)
-        changed = False
-        for idx in indices:
-            if diff == 0:
-                break
-            delta = step if diff > 0 else -step
-            if try_adjust(idx, delta):
-                diff -= delta
-                changed = True
-        if not changed:
-            # If we cannot change anything further, break
+    over = ints > hi
+    ints[over] = hi[over] - hi[over] % step
+    ints = np.maximum(ints, lo)
+
+    # Rebalance to target: move whole steps onto the items whose rounding was furthest
+    # off in the needed direction, skipping items that would leave their bounds
+    diff = target_sum - int(ints.sum())
+    sign = 1 if diff > 0 else -1
+    floor = np.maximum(lo, 0)
+    order = np.argsort(-(vals - ints) * sign, kind="stable")
+    remaining = abs(diff) // step
+    while remaining > 0:
+        moved = ints[order] + sign * step
+        feasible = order[(moved >= floor[order]) & (moved <= hi[order])]
+        if feasible.size == 0:
             break
-        cycles += 1
+        picks = feasible[:remaining]
+        ints[picks] += sign * step
+        remaining -= picks.size
+        diff -= sign * step * picks.size
 
     # Final guard: adjust any small residuals by relaxing step to 1 if needed
     if diff != 0:
-        for i in range(n):
-            if diff == 0:
-                break
-            delta = 1 if diff > 0 else -1
-            new_val = ints[i] + delta
-            hi = high[i] if high[i] is not None else float('inf')
-            if low[i] <= new_val <= hi:
-                ints[i] = new_val
-                diff -= delta
+        sign = 1 if diff > 0 else -1
+        moved = ints + sign
+        picks = np.flatnonzero((moved >= lo) & (moved <= hi))[:abs(diff)]
+        ints[picks] += sign
 
-    return ints
+    return ints.tolist()
 
 
 def normalize(weights: np.ndarray) -> np.ndarray:
@@ -99,61 +74,77 @@ def normalize(weights: np.ndarray) -> np.ndarray:
 LEVELS_PUBLIC = [f"L{i}" for i in range(1, 8)]  # L1..L7, L1=entry level
 
 
-def generate_structure_weights(n_levels: int = 7) -> np.ndarray:
+def _constant(values) -> np.ndarray:
+    arr = np.array(values, dtype=np.float64)
+    arr.setflags(write=False)
+    return arr
+
+
+# Loop-invariant per-level shapes (low to high), shared read-only across calls
+_LEVEL_STEPS = _constant(np.arange(7))
+_BASE_PYRAMID = _constant([0.25, 0.22, 0.18, 0.15, 0.10, 0.06, 0.04])
+_BASE_HIRING = _constant([0.05, 0.30, 0.30, 0.20, 0.10, 0.04, 0.01])
+_NH_OFFSET = _constant(np.linspace(1.0, -0.5, 7))
+_CAMPUS_PREF = _constant(normalize(np.array([1.6, 1.3, 1.1, 0.9, 0.7, 0.5, 0.3])))
+# Rows: campus promotion, social promotion, campus attrition, social attrition
+_BASE_RATES = _constant([
+    [0.15, 0.12, 0.10, 0.06, 0.04, 0.02, 0.01],
+    [0.12, 0.10, 0.08, 0.05, 0.03, 0.02, 0.01],
+    [0.25, 0.20, 0.18, 0.15, 0.12, 0.10, 0.08],
+    [0.22, 0.20, 0.18, 0.15, 0.12, 0.10, 0.08],
+])
+_RATE_CAPS = _constant([[0.20], [0.18], [0.35], [0.35]])
+_CAMPUS_START_OPTIONS = _constant([24.0, 24.5, 25.0])
+_SOCIAL_START_OPTIONS = _constant([27.0, 28.0, 29.0])
+_LEAVING_INCREMENT_OPTIONS = _constant([1.0, 1.5, 2.0])
+
+
+def generate_structure_weights(rng: np.random.Generator, n_levels: int = 7) -> np.ndarray:
     # Base pyramid shape (low to high): heavier at lower levels
-    base = np.array([0.25, 0.22, 0.18, 0.15, 0.10, 0.06, 0.04])
-    if n_levels != 7:
-        base = np.linspace(1.0, 0.3, n_levels)
-    noise = np.random.normal(0, 0.005, size=base.shape)
-    w = np.clip(base + noise, 0.01, None)
+    base = _BASE_PYRAMID if n_levels == 7 else np.linspace(1.0, 0.3, n_levels)
+    w = base + rng.normal(0, 0.005, size=base.shape)
+    np.clip(w, 0.01, None, out=w)
     return normalize(w)
 
 
-def generate_hiring_weights(n_levels: int = 7) -> np.ndarray:
+def generate_hiring_weights(rng: np.random.Generator, n_levels: int = 7) -> np.ndarray:
     # Social hiring concentrated in mid levels
-    base = np.array([0.05, 0.30, 0.30, 0.20, 0.10, 0.04, 0.01])
-    noise = np.random.normal(0, 0.005, size=base.shape)
-    w = np.clip(base + noise, 0.001, None)
+    w = _BASE_HIRING + rng.normal(0, 0.005, size=_BASE_HIRING.shape)
+    np.clip(w, 0.001, None, out=w)
     return normalize(w)
 
 
-def generate_age_profiles(n_levels: int = 7) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+def generate_age_profiles(rng: np.random.Generator, n_levels: int = 7) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     # Campus: ~24 at L1, +1.0 per level
-    campus_start = np.random.choice([24.0, 24.5, 25.0])
+    campus_start = _CAMPUS_START_OPTIONS[rng.integers(3)]
     campus_step = 1.0
-    campus_age = np.array([campus_start + i * campus_step for i in range(n_levels)])
+    campus_age = campus_start + _LEVEL_STEPS[:n_levels] * campus_step
     campus_age = np.round(campus_age * 2) / 2
     campus_age = np.clip(campus_age, 22.5, 40.0)
 
     # Social: ~28 at L1, +1.5 per level
-    social_start = np.random.choice([27.0, 28.0, 29.0])
+    social_start = _SOCIAL_START_OPTIONS[rng.integers(3)]
     social_step = 1.5
-    social_age = np.array([social_start + i * social_step for i in range(n_levels)])
+    social_age = social_start + _LEVEL_STEPS[:n_levels] * social_step
     social_age = np.round(social_age * 2) / 2
     social_age = np.clip(social_age, 25.0, 48.0)
 
     # Social new hire age
-    social_nh_age = social_age - np.linspace(1.0, -0.5, n_levels)
+    nh_offset = _NH_OFFSET if n_levels == 7 else np.linspace(1.0, -0.5, n_levels)
+    social_nh_age = social_age - nh_offset
     social_nh_age = np.round(social_nh_age * 2) / 2
     social_nh_age = np.clip(social_nh_age, 24.0, 48.0)
 
     return campus_age, social_age, social_nh_age
 
 
-def generate_rates(n_levels: int = 7) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
-    # Promotion rates decrease with level
-    campus_prom = np.array([0.15, 0.12, 0.10, 0.06, 0.04, 0.02, 0.01])
-    social_prom = np.array([0.12, 0.10, 0.08, 0.05, 0.03, 0.02, 0.01])
-
-    # Attrition rates: higher at low levels
-    campus_attr = np.array([0.25, 0.20, 0.18, 0.15, 0.12, 0.10, 0.08])
-    social_attr = np.array([0.22, 0.20, 0.18, 0.15, 0.12, 0.10, 0.08])
-
-    for arr, hi in [(campus_prom, 0.20), (social_prom, 0.18), (campus_attr, 0.35), (social_attr, 0.35)]:
-        noise = np.random.normal(0, 0.002, size=n_levels)
-        arr += noise
-        np.clip(arr, 0.0, hi, out=arr)
+def generate_rates(rng: np.random.Generator, n_levels: int = 7) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # Promotion rates decrease with level; attrition rates are higher at low levels.
+    # All four curves get their noise from one draw and are clipped together.
+    rates = _BASE_RATES + rng.normal(0, 0.002, size=(len(_BASE_RATES), n_levels))
+    np.clip(rates, 0.0, _RATE_CAPS, out=rates)
 
+    campus_prom, social_prom, campus_attr, social_attr = rates
     return campus_prom, social_prom, campus_attr, social_attr
 
 
@@ -170,8 +161,7 @@ def generate_counts(n_levels: int, total_headcount: int, campus_ratio: float, st
     level_totals = round_to_step(raw_totals.tolist(), target_sum=total_headcount, step=10)
 
     # Campus distribution preference: heavier at lower levels
-    pref = np.array([1.6, 1.3, 1.1, 0.9, 0.7, 0.5, 0.3])
-    pref = normalize(pref)
+    pref = _CAMPUS_PREF
 
     campus_total = int(round(total_headcount * campus_ratio))
     denom = np.sum(np.array(level_totals) * pref)
@@ -194,106 +184,101 @@ def generate_counts(n_levels: int, total_headcount: int, campus_ratio: float, st
 def generate_one(seed: int = 42,
                  total_headcount: Tuple[int, int] = (2200, 5800),
                  campus_ratio_range: Tuple[float, float] = (0.03, 0.12)) -> Dict:
-    set_seed(seed)
+    rng = np.random.default_rng(seed)
     n_levels = 7
 
     total_options = [2500, 3000, 3500, 4000, 4500, 5000]
-    total = random.choice(total_options)
+    total = total_options[rng.integers(len(total_options))]
 
     campus_ratio_options = [0.05, 0.08, 0.10, 0.12, 0.15]
-    campus_ratio = random.choice(campus_ratio_options)
+    campus_ratio = campus_ratio_options[rng.integers(len(campus_ratio_options))]
 
-    struct_w = generate_structure_weights(n_levels)
-    campus_age, social_age, social_nh_age = generate_age_profiles(n_levels)
-    campus_prom, social_prom, campus_attr, social_attr = generate_rates(n_levels)
+    struct_w = generate_structure_weights(rng, n_levels)
+    campus_age, social_age, social_nh_age = generate_age_profiles(rng, n_levels)
+    campus_prom, social_prom, campus_attr, social_attr = generate_rates(rng, n_levels)
 
     campus_counts, social_counts = generate_counts(n_levels, total, campus_ratio, struct_w)
 
-    hiring_w = generate_hiring_weights(n_levels)
+    hiring_w = generate_hiring_weights(rng, n_levels)
     # Round hiring weights to 0.001, ensure sum=1 by adjusting last element
     hiring_ratio = [float(f"{w:.3f}") for w in hiring_w]
     adjust = 1.0 - sum(hiring_ratio)
     hiring_ratio[-1] = float(f"{hiring_ratio[-1] + adjust:.3f}")
 
-    records = []
-    for i in range(n_levels):
-        leaving_increment = np.random.choice([1.0, 1.5, 2.0])
-        rec = {
-            "public_level": f"L{i+1}",
-            "level_index": 5 + i,
-            "campus_employee": campus_counts[i],
-            "social_employee": social_counts[i],
-            "campus_age": campus_age[i],
-            "social_age": social_age[i],
-            "campus_leaving_age": np.clip(campus_age[i] + leaving_increment, 23.0, 45.0),
-            "social_leaving_age": np.clip(social_age[i] + leaving_increment, 26.0, 50.0),
-            "social_new_hire_age": social_nh_age[i],
-            "campus_promotion_rate": campus_prom[i],
-            "social_promotion_rate": social_prom[i],
-            "campus_attrition_rate": campus_attr[i],
-            "social_attrition_rate": social_attr[i],
-            "hiring_ratio": hiring_ratio[i],
-        }
-        records.append(rec)
-
-    for rec in records:
-        rec["campus_age"] = float(f"{rec['campus_age']:.1f}")
-        rec["social_age"] = float(f"{rec['social_age']:.1f}")
-        rec["campus_leaving_age"] = float(f"{rec['campus_leaving_age']:.1f}")
-        rec["social_leaving_age"] = float(f"{rec['social_leaving_age']:.1f}")
-        rec["social_new_hire_age"] = float(f"{rec['social_new_hire_age']:.1f}")
-
-        for k in [
-            "campus_promotion_rate", "social_promotion_rate",
-            "campus_attrition_rate", "social_attrition_rate",
-        ]:
-            rec[k] = round(rec[k] * 100) / 100
-
-        rec["hiring_ratio"] = float(f"{rec['hiring_ratio']:.3f}")
+    # Round every column once on the arrays; the frame is built from them column-wise
+    leaving_increment = _LEAVING_INCREMENT_OPTIONS[rng.integers(3, size=n_levels)]
+    columns = {
+        "public_level": np.array(LEVELS_PUBLIC[:n_levels]),
+        "level_index": np.arange(5, 5 + n_levels),
+        "campus_employee": np.asarray(campus_counts, dtype=np.int64),
+        "social_employee": np.asarray(social_counts, dtype=np.int64),
+        "campus_age": np.round(campus_age, 1),
+        "social_age": np.round(social_age, 1),
+        "campus_leaving_age": np.round(np.clip(campus_age + leaving_increment, 23.0, 45.0), 1),
+        "social_leaving_age": np.round(np.clip(social_age + leaving_increment, 26.0, 50.0), 1),
+        "social_new_hire_age": np.round(social_nh_age, 1),
+        "campus_promotion_rate": np.round(campus_prom, 2),
+        "social_promotion_rate": np.round(social_prom, 2),
+        "campus_attrition_rate": np.round(campus_attr, 2),
+        "social_attrition_rate": np.round(social_attr, 2),
+        "hiring_ratio": np.asarray(hiring_ratio),
+    }
 
     return {
         "seed": seed,
         "total": total,
         "campus_ratio": float(f"{campus_ratio:.3f}"),
-        "records": records,
+        "columns": columns,
     }
 
 
 def to_dataframe(payload: Dict) -> pd.DataFrame:
-    df = pd.DataFrame(payload["records"])
-    df["level"] = df["public_level"]
+    columns = payload["columns"]
     cols = [
         "level", "campus_employee", "social_employee", "campus_age", "social_age",
         "campus_leaving_age", "social_leaving_age", "social_new_hire_age",
         "campus_promotion_rate", "social_promotion_rate",
         "campus_attrition_rate", "social_attrition_rate", "hiring_ratio",
     ]
-    df = df[cols]
-    df = df.sort_values(by="level", key=lambda s: s.str.replace('L', '').astype(int))
+    df = pd.DataFrame({"level": columns["public_level"], **{c: columns[c] for c in cols[1:]}})
+    df = df.iloc[np.argsort(columns["level_index"], kind="stable")]
     return df
 
 
+def generate_and_write(seed: int, output_dir: str, file_suffix: str) -> str:
+    # Each preset draws from its own generator seeded by `seed`
+    payload = generate_one(seed=seed)
+    df_pub = to_dataframe(payload)
+    pub_path = os.path.join(output_dir, f"sample_dept_{file_suffix}.csv")
+    df_pub.to_csv(pub_path, index=False, lineterminator="\n")
+    return pub_path
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate synthetic presets for talent structure model")
     parser.add_argument("--output", default="data",
                         help="Output directory for L1-L7 format CSVs")
     parser.add_argument("--count", type=int, default=2, help="How many files to generate")
     parser.add_argument("--seed", type=int, default=20241111, help="Random seed base")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for generation (default: 1, serial)")
 
     args = parser.parse_args()
 
     os.makedirs(args.output, exist_ok=True)
 
-    for i in range(args.count):
-        seed = args.seed + i
-        payload = generate_one(seed=seed)
-
-        file_suffix = chr(ord('A') + i)
-
-        df_pub = to_dataframe(payload)
-        pub_path = os.path.join(args.output, f"sample_dept_{file_suffix}.csv")
-        df_pub.to_csv(pub_path, index=False)
-        print(f"Generated {pub_path}")
+    seeds = [args.seed + i for i in range(args.count)]
+    suffixes = [chr(ord('A') + i) for i in range(args.count)]
+
+    # Presets are independent; only spin up a process pool when asked for more than one worker
+    if args.workers > 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            for pub_path in executor.map(generate_and_write, seeds, [args.output] * args.count, suffixes):
+                print(f"Generated {pub_path}")
+    else:
+        for seed, suffix in zip(seeds, suffixes):
+            pub_path = generate_and_write(seed, args.output, suffix)
+            print(f"Generated {pub_path}")
 
     print("Done.")
 
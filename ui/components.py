@@ -1,5 +1,6 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import os
 import io
 from typing import Dict, Tuple, List
@@ -7,6 +8,168 @@ from config.column_config import COLUMN_CONFIG
 from config.constants import DEFAULT_CAMPUS_RATIO, LEVELS
 from utils.plot_utils import plot_structure_distribution, plot_trend_charts
 
+# Level labels in display order (high to low)
+LEVEL_LABELS = [f"L{l}" for l in LEVELS]
+
+# Column configuration of the parameter editor, built once at import
+_DATA_EDITOR_COLUMN_CONFIG = {
+    "level": st.column_config.TextColumn(
+        label="职级",
+        help="职级范围从L1到L7",
+        width="small"
+    ),
+    "campus_employee": st.column_config.NumberColumn(
+        label="现有校招人数",
+        help="当前各职级校招人数",
+        format="%d"
+    ),
+    "social_employee": st.column_config.NumberColumn(
+        label="现有社招人数",
+        help="当前各职级社招人数",
+        format="%d"
+    ),
+    "level_structure": st.column_config.NumberColumn(
+        label="职级结构",
+        help="当前各职级人数占总人数的百分比",
+        format="%.2f%%"
+    ),
+    # Add configuration for other columns
+    **{
+        col: st.column_config.NumberColumn(**config)
+        for col, config in COLUMN_CONFIG.items()
+        if col not in ["level", "campus_employee", "social_employee"]
+    }
+}
+
+# Column configuration of the per-year prediction tables, built once at import
+_PREDICTION_COLUMN_CONFIG = {
+    "职级": st.column_config.TextColumn(
+        label="职级",
+        help="L1-L7表示职级，最后一行为合计",
+        width="small"
+    ),
+    "现有校招": st.column_config.NumberColumn(
+        label="现有校招",
+        help="当前各职级校招人数",
+        format="%d"
+    ),
+    "现有社招": st.column_config.NumberColumn(
+        label="现有社招",
+        help="当前各职级社招人数",
+        format="%d"
+    ),
+    "现有校招占比": st.column_config.NumberColumn(
+        label="现有校招占比",
+        help="当前各职级校招人数占比",
+        format="%.2f%%"
+    ),
+    "预测校招": st.column_config.NumberColumn(
+        label="预测校招",
+        help="预测年底校招人数",
+        format="%d"
+    ),
+    "预测社招": st.column_config.NumberColumn(
+        label="预测社招",
+        help="预测年底社招人数",
+        format="%d"
+    ),
+    "预测校招占比": st.column_config.NumberColumn(
+        label="预测校招占比",
+        help="预测年底校招人数占比",
+        format="%.2f%%"
+    ),
+    "预测总数": st.column_config.NumberColumn(
+        label="预测总数",
+        help="预测年底总人数",
+        format="%d"
+    ),
+    "预测职级结构": st.column_config.NumberColumn(
+        label="预测职级结构",
+        help="预测年底各职级人数占总人数的百分比",
+        format="%.2f%%"
+    )
+}
+
+
+def _level_array(values: Dict[int, int]) -> np.ndarray:
+    """Convert level-keyed values to an array in display order
+
+    Args:
+        values: Values keyed by level
+
+    Returns:
+        np.ndarray: Values ordered like LEVELS
+    """
+    return np.fromiter((values[l] for l in LEVELS), dtype=np.int64, count=len(LEVELS))
+
+
+def _with_summary(values: np.ndarray, summary: float) -> np.ndarray:
+    """Return the per-level values followed by their summary value
+
+    Args:
+        values: Values ordered like LEVELS
+        summary: Value for the trailing summary row
+
+    Returns:
+        np.ndarray: Array of length len(values) + 1
+    """
+    column = np.empty(len(values) + 1, dtype=np.result_type(values, summary))
+    column[:-1] = values
+    column[-1] = summary
+    return column
+
+
+def _encode_excel(sheets: Dict[str, pd.DataFrame]) -> bytes:
+    """Encode DataFrames as an Excel workbook, one sheet per entry
+
+    Args:
+        sheets: DataFrames keyed by sheet name
+
+    Returns:
+        bytes: Encoded xlsx file
+    """
+    output = io.BytesIO()
+    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
+        for sheet_name, df in sheets.items():
+            df.to_excel(writer, sheet_name=sheet_name, index=False)
+    return output.getvalue()
+
+
+# Charts are read-only snapshots: keep hover tooltips, drop the mode bar and zoom handlers
+_PLOTLY_CONFIG = {
+    'displayModeBar': False,
+    'scrollZoom': False,
+    'doubleClick': False
+}
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_trend(years: List[str], metrics: Dict[str, List]):
+    """Build the trend chart, reusing the figure while its inputs are unchanged
+
+    Args:
+        years: List of years
+        metrics: Metrics data
+
+    Returns:
+        go.Figure: Trend chart
+    """
+    return plot_trend_charts(years, metrics)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_structure(levels: List[int], structures: List[Dict]):
+    """Build the level structure chart, reusing the figure while its inputs are unchanged
+
+    Args:
+        levels: List of levels
+        structures: Level structure data
+
+    Returns:
+        go.Figure: Level structure chart
+    """
+    return plot_structure_distribution(levels, structures)
+
 class SidebarComponent:
     """Sidebar component for handling parameter input and file selection"""
     
@@ -26,7 +189,7 @@ class SidebarComponent:
                 st.sidebar.warning(f"已创建{data_dir}目录，请放入CSV参数文件")
             
             # Get CSV file list
-            csv_files = [f for f in os.listdir(data_dir) if f.endswith('.csv')]
+            csv_files = sorted(f for f in os.listdir(data_dir) if f.endswith('.csv'))
             
             if not csv_files:
                 st.sidebar.error(f"在{data_dir}目录中未找到CSV文件")
@@ -92,50 +255,20 @@ class DataEditorComponent:
         st.subheader("职级参数配置")
         
         # Modify level display format
-        param_df['level'] = param_df['level'].apply(lambda x: f"L{x}")
+        param_df['level'] = 'L' + param_df['level'].astype(str)
         
         # Calculate current level structure
         total_employees = param_df['campus_employee'] + param_df['social_employee']
         total_sum = total_employees.sum()
         param_df['level_structure'] = (total_employees / total_sum * 100) if total_sum > 0 else 0
         
-        # Set table column configuration
-        column_config = {
-            "level": st.column_config.TextColumn(
-                label="职级",
-                help="职级范围从L1到L7",
-                width="small"
-            ),
-            "campus_employee": st.column_config.NumberColumn(
-                label="现有校招人数",
-                help="当前各职级校招人数",
-                format="%d"
-            ),
-            "social_employee": st.column_config.NumberColumn(
-                label="现有社招人数",
-                help="当前各职级社招人数",
-                format="%d"
-            ),
-            "level_structure": st.column_config.NumberColumn(
-                label="职级结构",
-                help="当前各职级人数占总人数的百分比",
-                format="%.2f%%"
-            )
-        }
-        
-        # Add configuration for other columns
-        for col, config in COLUMN_CONFIG.items():
-            if col not in ["level", "campus_employee", "social_employee"]:
-                column_config[col] = st.column_config.NumberColumn(**config)
-        
         # Convert rate data to percentage display
         rate_columns = [
             'campus_promotion_rate', 'social_promotion_rate',
             'campus_attrition_rate', 'social_attrition_rate',
             'hiring_ratio'
         ]
-        for col in rate_columns:
-            param_df[col] = param_df[col] * 100
+        param_df[rate_columns] *= 100
         
         # Display data editor
         edited_df = st.data_editor(
@@ -143,15 +276,14 @@ class DataEditorComponent:
             hide_index=True,
             num_rows="fixed",
             use_container_width=True,
-            column_config=column_config
+            column_config=_DATA_EDITOR_COLUMN_CONFIG
         )
         
         # Convert percentage data back to decimal
-        for col in rate_columns:
-            edited_df[col] = edited_df[col] / 100
+        edited_df[rate_columns] /= 100
         
         # Convert level from L format back to number
-        edited_df['level'] = edited_df['level'].apply(lambda x: int(x.replace('L', '')))
+        edited_df['level'] = edited_df['level'].str.removeprefix('L').astype(int)
         
         return edited_df
 
@@ -198,8 +330,8 @@ class MetricsComponent:
         </div>
         """, unsafe_allow_html=True)
         
-        trend_fig = plot_trend_charts(years, metrics)
-        st.plotly_chart(trend_fig, use_container_width=True)
+        trend_fig = _cached_trend(years, metrics)
+        st.plotly_chart(trend_fig, use_container_width=True, config=_PLOTLY_CONFIG)
         
         st.markdown("<br>", unsafe_allow_html=True)
         
@@ -210,8 +342,8 @@ class MetricsComponent:
         </div>
         """, unsafe_allow_html=True)
         
-        structure_fig = plot_structure_distribution(LEVELS, structures)
-        st.plotly_chart(structure_fig, use_container_width=True)
+        structure_fig = _cached_structure(LEVELS, structures)
+        st.plotly_chart(structure_fig, use_container_width=True, config=_PLOTLY_CONFIG)
 
 class PredictionResultComponent:
     """Prediction result component for displaying detailed prediction data"""
@@ -233,54 +365,52 @@ class PredictionResultComponent:
             for i, result in enumerate(results):
                 st.markdown(f"##### 第{result['year']}年详细预测数据")
                 
-                # Build detailed data table
+                # Extract per-level values once, in display order
+                current_campus = _level_array(result['current_campus'])
+                current_social = _level_array(result['current_social'])
+                final_campus = _level_array(result['final_campus'])
+                final_social = _level_array(result['final_social'])
+                final_structure = _level_array(result['final_structure'])
+                current_level_total = current_campus + current_social
+                final_level_total = final_campus + final_social
+
+                # Per-year totals, reduced once and reused by the summary row
+                current_campus_total = current_campus.sum()
+                current_social_total = current_social.sum()
+                current_total = current_campus_total + current_social_total
+                total_predicted = final_structure.sum()
+                predicted_share = (
+                    final_structure / total_predicted * 100
+                    if total_predicted > 0 else np.zeros(len(LEVELS))
+                )
+
+                # Build detailed data table with the summary row in place,
+                # so the frame is allocated once instead of concatenated
                 result_df = pd.DataFrame({
-                    "职级": [f"L{l}" for l in LEVELS],
-                    "现有校招": [result['current_campus'][l] for l in LEVELS],
-                    "现有社招": [result['current_social'][l] for l in LEVELS],
-                    "现有校招占比": [
-                        100 * result['current_campus'][l] / 
-                        (result['current_campus'][l] + result['current_social'][l])
-                        if (result['current_campus'][l] + result['current_social'][l]) > 0 else 0 
-                        for l in LEVELS
-                    ],
-                    "预测校招": [result['final_campus'][l] for l in LEVELS],
-                    "预测社招": [result['final_social'][l] for l in LEVELS],
-                    "预测校招占比": [
-                        100 * result['final_campus'][l] / 
-                        (result['final_campus'][l] + result['final_social'][l])
-                        if (result['final_campus'][l] + result['final_social'][l]) > 0 else 0 
-                        for l in LEVELS
-                    ],
-                    "预测总数": [result['final_structure'][l] for l in LEVELS]
-                })
-                
-                # Calculate predicted level structure
-                total_predicted = result_df["预测总数"].sum()
-                result_df["预测职级结构"] = (
-                    result_df["预测总数"] / total_predicted * 100
-                ) if total_predicted > 0 else 0
-                
-                # Add summary row
-                summary_row = pd.DataFrame({
-                    "职级": ["合计"],
-                    "现有校招": [sum(result['current_campus'][l] for l in LEVELS)],
-                    "现有社招": [sum(result['current_social'][l] for l in LEVELS)],
-                    "现有校招占比": [
-                        100 * sum(result['current_campus'][l] for l in LEVELS) / 
-                        sum(result['current_campus'][l] + result['current_social'][l] for l in LEVELS)
-                        if sum(result['current_campus'][l] + result['current_social'][l] for l in LEVELS) > 0 else 0
-                    ],
-                    "预测校招": [sum(result['final_campus'][l] for l in LEVELS)],
-                    "预测社招": [sum(result['final_social'][l] for l in LEVELS)],
-                    "预测校招占比": [100 * result['campus_ratio']],
-                    "预测总数": [sum(result['final_structure'][l] for l in LEVELS)],
-                    "预测职级结构": [100.0]
+                    "职级": LEVEL_LABELS + ["合计"],
+                    "现有校招": _with_summary(current_campus, current_campus_total),
+                    "现有社招": _with_summary(current_social, current_social_total),
+                    "现有校招占比": _with_summary(
+                        np.divide(
+                            100 * current_campus, current_level_total,
+                            out=np.zeros(len(LEVELS)), where=current_level_total > 0
+                        ),
+                        100 * current_campus_total / current_total
+                        if current_total > 0 else 0.0
+                    ),
+                    "预测校招": _with_summary(final_campus, final_campus.sum()),
+                    "预测社招": _with_summary(final_social, final_social.sum()),
+                    "预测校招占比": _with_summary(
+                        np.divide(
+                            100 * final_campus, final_level_total,
+                            out=np.zeros(len(LEVELS)), where=final_level_total > 0
+                        ),
+                        100 * result['campus_ratio']
+                    ),
+                    "预测总数": _with_summary(final_structure, total_predicted),
+                    "预测职级结构": _with_summary(predicted_share, 100.0)
                 })
                 
-                # Merge original table and summary row
-                result_df = pd.concat([result_df, summary_row], ignore_index=True)
-                
                 # Save DataFrame for Excel export
                 all_dfs[f"第{result['year']}年"] = result_df.copy()
                 
@@ -289,71 +419,15 @@ class PredictionResultComponent:
                     result_df,
                     hide_index=True,
                     use_container_width=True,
-                    column_config={
-                        "职级": st.column_config.TextColumn(
-                            label="职级",
-                            help="L1-L7表示职级，最后一行为合计",
-                            width="small"
-                        ),
-                        "现有校招": st.column_config.NumberColumn(
-                            label="现有校招",
-                            help="当前各职级校招人数",
-                            format="%d"
-                        ),
-                        "现有社招": st.column_config.NumberColumn(
-                            label="现有社招",
-                            help="当前各职级社招人数",
-                            format="%d"
-                        ),
-                        "现有校招占比": st.column_config.NumberColumn(
-                            label="现有校招占比",
-                            help="当前各职级校招人数占比",
-                            format="%.2f%%"
-                        ),
-                        "预测校招": st.column_config.NumberColumn(
-                            label="预测校招",
-                            help="预测年底校招人数",
-                            format="%d"
-                        ),
-                        "预测社招": st.column_config.NumberColumn(
-                            label="预测社招",
-                            help="预测年底社招人数",
-                            format="%d"
-                        ),
-                        "预测校招占比": st.column_config.NumberColumn(
-                            label="预测校招占比",
-                            help="预测年底校招人数占比",
-                            format="%.2f%%"
-                        ),
-                        "预测总数": st.column_config.NumberColumn(
-                            label="预测总数",
-                            help="预测年底总人数",
-                            format="%d"
-                        ),
-                        "预测职级结构": st.column_config.NumberColumn(
-                            label="预测职级结构",
-                            help="预测年底各职级人数占总人数的百分比",
-                            format="%.2f%%"
-                        )
-                    }
+                    column_config=_PREDICTION_COLUMN_CONFIG
                 )
             
             # Add Excel download button
             if all_dfs:
                 st.markdown("<br>", unsafe_allow_html=True)
                 
-                # Create a function to generate Excel file
-                def to_excel():
-                    output = io.BytesIO()
-                    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                        for sheet_name, df in all_dfs.items():
-                            df.to_excel(writer, sheet_name=sheet_name, index=False)
-                    
-                    output.seek(0)
-                    return output
-                
                 # Create download button
-                excel_file = to_excel()
+                excel_file = _encode_excel(all_dfs)
                 
                 # Get forecast years and campus ratio info for filename
                 forecast_years = len(results)  # How many years forecasted
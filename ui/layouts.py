@@ -1,6 +1,7 @@
 import os
 from typing import Dict, List, Tuple, Any, Optional, Union, cast
 
+import pandas as pd
 import streamlit as st
 
 from config.constants import DEFAULT_CAMPUS_RATIO, LEVELS
@@ -14,6 +15,43 @@ from .components import (
 )
 
 
+@st.cache_resource
+def _get_predictor() -> HRPredictor:
+    """
+    Get the process-wide predictor instance
+
+    Returns:
+        HRPredictor: Shared predictor instance
+    """
+    return HRPredictor()
+
+
+@st.cache_resource
+def _get_data_processor() -> DataProcessor:
+    """
+    Get the process-wide data processor instance
+
+    Returns:
+        DataProcessor: Shared data processor instance
+    """
+    return DataProcessor()
+
+
+@st.cache_data(show_spinner=False)
+def _load_preset(file_path: str, mtime: float) -> pd.DataFrame:
+    """
+    Load a preset CSV file, reusing the parsed DataFrame across reruns
+
+    Args:
+        file_path: CSV file path
+        mtime: File modification time, part of the cache key so edits to the file are picked up
+
+    Returns:
+        pd.DataFrame: DataFrame containing all parameters
+    """
+    return DataProcessor.load_preset_from_csv(file_path)
+
+
 class AppLayout:
     """
     Application Main Layout Class
@@ -58,19 +96,11 @@ class AppLayout:
         """
         Initialize application layout
 
-        Create predictor and data processor instances, set page configuration
+        Fetch the shared predictor and data processor instances
         """
-        # Create core component instances
-        self.predictor = HRPredictor()
-        self.data_processor = DataProcessor()
-
-        # Set page to wide screen mode
-        st.set_page_config(
-            page_title="人才金字塔预测 | Workforce Compass",
-            page_icon="📊",
-            layout="wide",
-            initial_sidebar_state="expanded"
-        )
+        # Core components are stateless, so one instance serves every session and rerun
+        self.predictor = _get_predictor()
+        self.data_processor = _get_data_processor()
 
     def render_description(self) -> None:
         """
@@ -114,23 +144,95 @@ class AppLayout:
                            [r['campus_ratio'] for r in prediction_results]
         }
 
-        # Prepare level structure data
-        current_structure = {
-            'year': 'Current',
-            **{
-                level: edited_df[edited_df['level'] == level]['campus_employee'].iloc[0] +
-                      edited_df[edited_df['level'] == level]['social_employee'].iloc[0]
-                for level in edited_df['level']
+        # Prepare level structure data; the predictor already reports the
+        # starting headcount per level, so only fall back to the table without results
+        if prediction_results:
+            first_year = prediction_results[0]
+            current_structure = {
+                'year': 'Current',
+                **{
+                    level: first_year['current_campus'][level] + first_year['current_social'][level]
+                    for level in first_year['current_campus']
+                }
             }
-        }
-
-        structures = [current_structure] + [
-            {'year': f'Year {r["year"]}'} | r['final_structure']
+        else:
+            level_totals = (
+                edited_df['campus_employee'] + edited_df['social_employee']
+            ).groupby(edited_df['level']).sum()
+            current_structure = {'year': 'Current', **level_totals.to_dict()}
+
+        structures = [current_structure]
+        structures.extend(
+            {'year': f'Year {r["year"]}', **r['final_structure']}
             for r in prediction_results
-        ]
+        )
 
         return years, metrics_data, structures
 
+    @st.fragment
+    def render_prediction(
+        self,
+        edited_df: pd.DataFrame,
+        current_metrics: Dict[str, Union[int, float]],
+        campus_ratio: float,
+        campus_new_hire_age: float,
+        target_total: int,
+        forecast_years: int
+    ) -> None:
+        """
+        Run the prediction and render metrics, charts and result tables
+
+        Runs as a fragment: interactions inside it (such as the Excel download)
+        rerun only this block, not the sidebar, CSV loading and data editor.
+
+        Args:
+            edited_df: Edited parameter DataFrame
+            current_metrics: Current metrics data
+            campus_ratio: Campus recruitment ratio
+            campus_new_hire_age: Campus new hire age
+            target_total: Target total headcount at year end
+            forecast_years: Number of years to forecast
+        """
+        try:
+            # Update current metrics
+            current_metrics = {
+                **current_metrics,
+                'target_total': target_total,
+                'campus_ratio': campus_ratio
+            }
+
+            # Prepare prediction parameters
+            prediction_params = self.data_processor.prepare_prediction_params(
+                edited_df,
+                campus_ratio,
+                campus_new_hire_age,
+                target_total
+            )
+
+            # Perform multi-year prediction (not memoized: hashing the params costs more than the forecast)
+            prediction_results = self.predictor.predict_multiple_years(
+                prediction_params,
+                forecast_years
+            )
+
+            # Prepare chart data
+            years, metrics_data, structures = self.prepare_chart_data(
+                current_metrics,
+                prediction_results,
+                edited_df
+            )
+
+            # Render metrics component
+            MetricsComponent.render_current_metrics(current_metrics)
+            MetricsComponent.render_prediction_charts(years, metrics_data, structures)
+
+            # Render prediction result component
+            PredictionResultComponent.render(prediction_results, campus_ratio)
+
+        except Exception as e:
+            st.error(f"处理数据时出错: {str(e)}")
+            st.exception(e)
+
     def render(self) -> None:
         """
         Render the entire application interface
@@ -159,9 +261,8 @@ class AppLayout:
 
         try:
             # Load parameter DataFrame
-            param_df = self.data_processor.load_preset_from_csv(
-                os.path.join("data", selected_file)
-            )
+            file_path = os.path.join("data", selected_file)
+            param_df = _load_preset(file_path, os.path.getmtime(file_path))
 
             # Render data editor component
             edited_df = DataEditorComponent.render(param_df)
@@ -179,40 +280,16 @@ class AppLayout:
                     help="默认与当前总人数相同"
                 )
 
-            # Update current metrics
-            current_metrics.update({
-                'target_total': target_total,
-                'campus_ratio': campus_ratio
-            })
-
-            # Prepare prediction parameters
-            prediction_params = self.data_processor.prepare_prediction_params(
+            # Render prediction, charts and result tables
+            self.render_prediction(
                 edited_df,
+                current_metrics,
                 campus_ratio,
                 campus_new_hire_age,
-                target_total
-            )
-
-            # Perform multi-year prediction
-            prediction_results = self.predictor.predict_multiple_years(
-                prediction_params,
+                target_total,
                 forecast_years
             )
 
-            # Prepare chart data
-            years, metrics_data, structures = self.prepare_chart_data(
-                current_metrics,
-                prediction_results,
-                edited_df
-            )
-
-            # Render metrics component
-            MetricsComponent.render_current_metrics(current_metrics)
-            MetricsComponent.render_prediction_charts(years, metrics_data, structures)
-
-            # Render prediction result component
-            PredictionResultComponent.render(prediction_results, campus_ratio)
-
         except Exception as e:
             st.error(f"处理数据时出错: {str(e)}")
             st.exception(e)
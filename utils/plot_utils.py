@@ -1,7 +1,9 @@
-from typing import List, Dict, Any, Union, Optional, Tuple
+from typing import TYPE_CHECKING, List, Dict, Any, Union, Optional, Tuple
 
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import numpy as np
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
 
 
 # Define color constants
@@ -13,7 +15,57 @@ CHART_COLORS = {
 }
 
 
-def plot_structure_distribution(levels: List[int], structures: List[Dict[str, Any]]) -> go.Figure:
+def _subplot_row_layout(
+    titles: List[str],
+    horizontal_spacing: float,
+    xaxis: Optional[Dict[str, Any]] = None,
+    yaxis: Optional[Dict[str, Any]] = None,
+    title_y: float = 1.0
+) -> Dict[str, Any]:
+    """
+    Build axes and title annotations for a single row of subplots
+
+    Produces the same layout as make_subplots(rows=1, cols=len(titles)) as a plain
+    dictionary, so the whole figure is validated once by the go.Figure constructor
+    instead of through make_subplots and per-subplot add_trace/update calls.
+    Subplot i is referenced by traces as xaxis=f"x{suffix}", yaxis=f"y{suffix}",
+    where suffix is "" for the first subplot and str(i + 1) otherwise.
+
+    Args:
+        titles: Subplot titles, one per column
+        horizontal_spacing: Space between subplots as a fraction of the plot width
+        xaxis: Settings applied to every subplot's x-axis
+        yaxis: Settings applied to every subplot's y-axis
+        title_y: Vertical position of the subplot titles in paper coordinates
+
+    Returns:
+        Dict[str, Any]: Layout entries for every xaxis/yaxis pair plus annotations
+    """
+    n_cols = len(titles)
+    width = (1 - horizontal_spacing * (n_cols - 1)) / n_cols
+
+    layout: Dict[str, Any] = {'annotations': []}
+    for i, title in enumerate(titles):
+        suffix = '' if i == 0 else str(i + 1)
+        start = i * (width + horizontal_spacing)
+        layout[f'xaxis{suffix}'] = {'anchor': f'y{suffix}', 'domain': [start, start + width], **(xaxis or {})}
+        layout[f'yaxis{suffix}'] = {'anchor': f'x{suffix}', 'domain': [0.0, 1.0], **(yaxis or {})}
+        layout['annotations'].append({
+            'text': title,
+            'x': start + width / 2,
+            'y': title_y,
+            'xref': 'paper',
+            'yref': 'paper',
+            'xanchor': 'center',
+            'yanchor': 'bottom',
+            'showarrow': False,
+            'font': {'size': 16}
+        })
+
+    return layout
+
+
+def plot_structure_distribution(levels: List[int], structures: List[Dict[str, Any]]) -> "go.Figure":
     """
     Plot horizontal bar chart of level structure distribution
 
@@ -26,77 +78,68 @@ def plot_structure_distribution(levels: List[int], structures: List[Dict[str, An
     Returns:
         go.Figure: Generated chart object
     """
-    # All charts in one row
-    n_structures = len(structures)
-
-    # Create subplots
-    fig = make_subplots(
-        rows=1,
-        cols=n_structures,
-        subplot_titles=[structure['year'] for structure in structures],
-        horizontal_spacing=0.05
-    )
-
-    # Calculate maximum percentage value across all charts
-    max_percentage = 0
-    all_percentages: List[List[float]] = []
+    # Plotly is imported on first use so importing this module stays cheap
+    import plotly.graph_objects as go
 
-    for structure in structures:
-        # Sort levels from low to high (1 to 7)
-        sorted_levels = sorted(levels)
-        total = sum(structure[l] for l in sorted_levels if l in structure)
+    # Sort levels from low to high (1 to 7); shared by every subplot
+    sorted_levels = sorted(levels)
+    y_labels = [f"L{l}" for l in sorted_levels]
 
-        # Calculate percentage for each level
-        percentages = [
-            (structure[l] / total * 100) if total > 0 and l in structure else 0
-            for l in sorted_levels
-        ]
+    # Calculate percentage for each (year, level) cell in one pass
+    counts = np.array(
+        [[structure.get(l, 0) for l in sorted_levels] for structure in structures],
+        dtype=np.float64
+    ).reshape(len(structures), len(sorted_levels))
+    totals = counts.sum(axis=1, keepdims=True)
+    percentage_matrix = np.divide(counts, totals, out=np.zeros_like(counts), where=totals > 0) * 100
 
-        all_percentages.append(percentages)
-        max_percentage = max(max_percentage, max(percentages) if percentages else 0)
+    # Calculate maximum percentage value across all charts
+    max_percentage = percentage_matrix.max() if percentage_matrix.size else 0
 
     # Calculate axis maximum (round up to nearest multiple of 5 with some margin)
     axis_max = (int((max_percentage + 4) / 5) + 1) * 5
 
-    # Create a bar chart for each year
-    for i, (structure, percentages) in enumerate(zip(structures, all_percentages)):
-        # Sort levels from low to high (1 to 7)
-        sorted_levels = sorted(levels)
+    # All charts in one row; every subplot shares the same axis settings
+    layout = _subplot_row_layout(
+        [structure['year'] for structure in structures],
+        horizontal_spacing=0.05,
+        title_y=1.05,  # Lift subplot titles above the chart area
+        xaxis=dict(
+            showticklabels=False,  # Hide x-axis tick labels
+            showgrid=False,  # Don't show grid lines
+            range=[0, axis_max]  # Use calculated maximum
+        ),
+        yaxis=dict(
+            categoryorder='array',  # Use fixed order
+            categoryarray=y_labels,  # Set fixed level order
+            showgrid=False  # Don't show grid lines
+        )
+    )
+
+    # Create a bar chart for each year; rows stay numpy arrays so plotly
+    # validates them with a dtype check instead of element by element
+    traces = []
+    for i, percentages in enumerate(percentage_matrix):
+        suffix = '' if i == 0 else str(i + 1)
 
         # Add bar chart
-        fig.add_trace(
+        traces.append(
             go.Bar(
                 x=percentages,  # Use percentage data
-                y=[f"L{l}" for l in sorted_levels],  # Levels from low to high
+                y=y_labels,  # Levels from low to high
                 orientation='h',
-                text=[f"{p:.1f}%" for p in percentages],  # Display percentage
+                texttemplate="%{x:.1f}%",  # Display percentage, formatted by plotly.js
                 textposition='outside',
                 marker_color=CHART_COLORS['primary'],  # Use standard blue
                 showlegend=False,
-                hovertemplate="Level %{y}: %{x:.1f}%<extra></extra>"  # Custom hover tooltip
-            ),
-            row=1,
-            col=i+1
+                hovertemplate="Level %{y}: %{x:.1f}%<extra></extra>",  # Custom hover tooltip
+                xaxis=f'x{suffix}',
+                yaxis=f'y{suffix}'
+            )
         )
 
-        # Update x-axis for each subplot
-        fig.update_xaxes(
-            showticklabels=False,  # Hide x-axis tick labels
-            showgrid=False,  # Don't show grid lines
-            range=[0, axis_max],  # Use calculated maximum
-            row=1,
-            col=i+1
-        )
-
-        # Update y-axis for each subplot
-        fig.update_yaxes(
-            title_text=None,  # Remove y-axis title
-            categoryorder='array',  # Use fixed order
-            categoryarray=[f"L{l}" for l in sorted_levels],  # Set fixed level order
-            showgrid=False,  # Don't show grid lines
-            row=1,
-            col=i+1
-        )
+    # Build the figure in a single validated pass
+    fig = go.Figure(data=traces, layout=layout)
 
     # Update overall layout
     fig.update_layout(
@@ -120,14 +163,10 @@ def plot_structure_distribution(levels: List[int], structures: List[Dict[str, An
         )
     )
 
-    # Adjust subplot title positions
-    for i in range(len(structures)):
-        fig.layout.annotations[i].update(y=1.05)
-
     return fig
 
 
-def plot_trend_charts(years: List[str], metrics: Dict[str, List[float]]) -> go.Figure:
+def plot_trend_charts(years: List[str], metrics: Dict[str, List[float]]) -> "go.Figure":
     """
     Plot key metrics trend charts
 
@@ -138,92 +177,77 @@ def plot_trend_charts(years: List[str], metrics: Dict[str, List[float]]) -> go.F
     Returns:
         go.Figure: Generated chart object
     """
-    # Create three subplots
-    fig = make_subplots(
-        rows=1, cols=3,
-        subplot_titles=('Average Level', 'Average Age', 'Campus Ratio'),
-        horizontal_spacing=0.08
+    # Plotly is imported on first use so importing this module stays cheap
+    import plotly.graph_objects as go
+
+    # Three subplots in one row with shared axis settings; only the y-ranges differ
+    layout = _subplot_row_layout(
+        ['Average Level', 'Average Age', 'Campus Ratio'],
+        horizontal_spacing=0.08,
+        xaxis=dict(
+            showgrid=False,
+            showticklabels=True,
+            tickangle=30 if len(years) > 3 else 0  # Tilt labels when there are many years
+        ),
+        yaxis=dict(
+            showticklabels=True,
+            showgrid=False
+        )
     )
 
     # Use predefined colors
     colors = CHART_COLORS['palette']
 
-    # Add average level bar chart
-    fig.add_trace(
-        go.Bar(
-            x=years,
-            y=metrics['average_level'],
-            text=[f"{v:.2f}" for v in metrics['average_level']],
-            textposition='outside',
-            marker_color=colors[0],
-            hovertemplate="Year: %{x}<br>Average Level: %{y:.2f}<extra></extra>"
+    # Convert metric series once; campus ratio is shown in percent
+    average_level = np.asarray(metrics['average_level'], dtype=np.float64)
+    average_age = np.asarray(metrics['average_age'], dtype=np.float64)
+    campus_ratio_pct = np.asarray(metrics['campus_ratio'], dtype=np.float64) * 100
+
+    # Bar chart per metric: values, bar label template and hover tooltip
+    # (labels are formatted by plotly.js from the values, not built as strings here)
+    series = [
+        (
+            average_level,
+            "%{y:.2f}",
+            "Year: %{x}<br>Average Level: %{y:.2f}<extra></extra>"
         ),
-        row=1, col=1
-    )
-
-    # Add average age bar chart
-    fig.add_trace(
-        go.Bar(
-            x=years,
-            y=metrics['average_age'],
-            text=[f"{v:.1f}" for v in metrics['average_age']],
-            textposition='outside',
-            marker_color=colors[1],
-            hovertemplate="Year: %{x}<br>Average Age: %{y:.1f}<extra></extra>"
+        (
+            average_age,
+            "%{y:.1f}",
+            "Year: %{x}<br>Average Age: %{y:.1f}<extra></extra>"
         ),
-        row=1, col=2
-    )
-
-    # Add campus recruitment ratio bar chart
-    fig.add_trace(
+        (
+            campus_ratio_pct,
+            "%{y:.1f}%",
+            "Year: %{x}<br>Campus Ratio: %{y:.1f}%<extra></extra>"
+        ),
+    ]
+    traces = [
         go.Bar(
             x=years,
-            y=[v * 100 for v in metrics['campus_ratio']],
-            text=[f"{v:.1%}" for v in metrics['campus_ratio']],
+            y=values,
+            texttemplate=texttemplate,
             textposition='outside',
-            marker_color=colors[2],
-            hovertemplate="Year: %{x}<br>Campus Ratio: %{text}<extra></extra>"
-        ),
-        row=1, col=3
-    )
+            marker_color=colors[i],
+            hovertemplate=hovertemplate,
+            xaxis=f"x{'' if i == 0 else i + 1}",
+            yaxis=f"y{'' if i == 0 else i + 1}"
+        )
+        for i, (values, texttemplate, hovertemplate) in enumerate(series)
+    ]
 
     # Calculate y-axis range for each chart (add 15% space for labels)
-    max_level = max(metrics['average_level']) * 1.15
-    max_age = max(metrics['average_age']) * 1.15
-    max_campus_ratio = max([v * 100 for v in metrics['campus_ratio']]) * 1.15
-
-    # Update y-axes
-    fig.update_yaxes(
-        showticklabels=True,
-        title_text=None,
-        showgrid=False,
-        range=[0, max_level],
-        row=1, col=1
-    )
-    fig.update_yaxes(
-        showticklabels=True,
-        title_text=None,
-        showgrid=False,
-        range=[0, max_age],
-        row=1, col=2
-    )
-    fig.update_yaxes(
-        showticklabels=True,
-        title_text=None,
-        showgrid=False,
-        range=[0, max_campus_ratio],
-        row=1, col=3
-    )
+    max_level = average_level.max() * 1.15
+    max_age = average_age.max() * 1.15
+    max_campus_ratio = campus_ratio_pct.max() * 1.15
 
-    # Update x-axes
-    for col in range(1, 4):
-        fig.update_xaxes(
-            showgrid=False,
-            showticklabels=True,
-            tickangle=30 if len(years) > 3 else 0,  # Tilt labels when there are many years
-            row=1,
-            col=col
-        )
+    # Set per-chart y-axis ranges
+    layout['yaxis']['range'] = [0, max_level]
+    layout['yaxis2']['range'] = [0, max_age]
+    layout['yaxis3']['range'] = [0, max_campus_ratio]
+
+    # Build the figure in a single validated pass
+    fig = go.Figure(data=traces, layout=layout)
 
     # Update overall layout
     fig.update_layout(
@@ -239,8 +263,4 @@ def plot_trend_charts(years: List[str], metrics: Dict[str, List[float]]) -> go.F
         )
     )
 
-    # Adjust subplot title positions
-    for i in range(len(fig.layout.annotations)):
-        fig.layout.annotations[i].update(y=1.0)
-
     return fig